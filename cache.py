@@ -32,3 +32,11 @@ def upsert_file_meta(con: sqlite3.Connection, key: str, path: str, etag: str | N
         (key, path, etag, last_modified, fetched_at),
     )
     con.commit()
+
+def move_file_meta(con: sqlite3.Connection, old_key: str, new_key: str, path: str) -> None:
+    con.execute("UPDATE files SET key = ?, path = ? WHERE key = ?", (new_key, path, old_key))
+    con.commit()
+
+def delete_file_meta(con: sqlite3.Connection, key: str) -> None:
+    con.execute("DELETE FROM files WHERE key = ?", (key,))
+    con.commit()
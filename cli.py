@@ -7,6 +7,7 @@ from prompt_toolkit.validation import Validator, ValidationError
 from .data import load_players
 from .core import run_compare
 from .model import SURFACE_MAP
+from .sources import DEFAULT_TOUR, levels as tour_levels, tours
 
 def _int_validator(min_v: int, max_v: int) -> Validator:
     def _validate(text: str) -> None:
@@ -19,15 +20,25 @@ def _int_validator(min_v: int, max_v: int) -> Validator:
     return Validator.from_callable(lambda t: (_validate(t), True)[1], error_message="Invalid number", move_cursor_to_end=True)
 
 def main() -> None:
-    players_df = load_players()
+    print("\nTennis Compare (interactive)\n")
+
+    tour_names = tours()
+    tour = prompt(
+        f"Tour ({'/'.join(t.upper() for t in tour_names)}): ",
+        completer=FuzzyWordCompleter([t.upper() for t in tour_names], WORD=True),
+        validator=Validator.from_callable(lambda t: (t.strip().lower() or DEFAULT_TOUR) in tour_names, error_message="Unknown tour"),
+        validate_while_typing=False,
+    ).strip().lower() or DEFAULT_TOUR
+    lower = prompt("Include lower-level matches? (y/N): ").strip().lower() in {"y", "yes"}
+    levels = tour_levels(tour) if lower else None
+
+    players_df = load_players(tour)
     names = players_df["name"].dropna().astype(str).unique().tolist()
     completer = FuzzyWordCompleter(names, WORD=True)
 
     # Infer year bounds from files typically available (1968..current-ish)
     min_year, max_year = 1968, 2030
 
-    print("\nTennis Compare (interactive)\n")
-
     p1 = prompt("Player A: ", completer=completer)
     y1 = prompt("Year A: ", validator=_int_validator(min_year, max_year), validate_while_typing=False)
     p2 = prompt("Player B: ", completer=completer)
@@ -42,14 +53,14 @@ def main() -> None:
     bo = prompt("Best of (3 or 5): ", validator=Validator.from_callable(lambda t: t.strip() in {"3","5"}, error_message="Enter 3 or 5"), validate_while_typing=False)
 
     try:
-        res = run_compare(p1, int(y1), p2, int(y2), surface, int(bo))
+        res = run_compare(p1, int(y1), p2, int(y2), surface, int(bo), tour=tour, levels=levels)
     except Exception as e:
         print(f"\nError: {e}\n")
         sys.exit(1)
 
     print("\n" + "="*60)
     print(f"{res.player_a} ({res.year_a}) vs {res.player_b} ({res.year_b})")
-    print(f"Surface: {res.surface} | BO{res.best_of}")
+    print(f"Tour: {res.tour.upper()} | Surface: {res.surface} | BO{res.best_of}")
     print("-"*60)
     print(f"Win Probability: {res.player_a}: {res.p_a_wins:.3f} | {res.player_b}: {1-res.p_a_wins:.3f}")
     if res.elo_a is not None and res.elo_b is not None:
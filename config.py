@@ -10,9 +10,8 @@ CACHE_DB_PATH = DEFAULT_CACHE_DIR / "cache.sqlite3"
 CACHE_DATA_DIR = DEFAULT_CACHE_DIR / "data"
 CACHE_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-# Jeff Sackmann tennis_atp raw base
-RAW_BASE = "https://raw.githubusercontent.com/JeffSackmann/tennis_atp/master"
-PLAYERS_CSV = f"{RAW_BASE}/atp_players.csv"
+# Jeff Sackmann raw base (one repo per tour: tennis_atp, tennis_wta)
+RAW_BASE = "https://raw.githubusercontent.com/JeffSackmann"
 
-def matches_csv_url(year: int) -> str:
-    return f"{RAW_BASE}/atp_matches_{year}.csv"
+# Max shards downloaded/parsed concurrently by the match loader
+LOADER_WORKERS = int(os.environ.get("TENNIS_COMPARE_WORKERS", "4"))
@@ -1,12 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 import pandas as pd
 
 from .data import load_players, load_matches
 from .names import resolve_player
 from .model import compute_elo_for_slice, match_win_prob_from_elos, adjust_for_best_of, SURFACE_MAP
 from .stats import compute_season_stats
+from .sources import DEFAULT_TOUR
 
 @dataclass
 class CompareResult:
@@ -25,10 +26,16 @@ class CompareResult:
     stats_b: dict | None
     notes: list[str]
     winner: str
+    tour: str = DEFAULT_TOUR
 
-def run_compare(player_a_raw: str, year_a: int, player_b_raw: str, year_b: int, surface: str, best_of: int) -> CompareResult:
+def run_compare(
+    player_a_raw: str, year_a: int, player_b_raw: str, year_b: int, surface: str, best_of: int,
+    *, tour: str = DEFAULT_TOUR, levels: Sequence[str] | None = None,
+) -> CompareResult:
     notes: list[str] = []
-    players_df = load_players()
+    tour = tour.lower()
+    # Names and ratings are partitioned by tour: only this tour's players/shards are loaded
+    players_df = load_players(tour)
 
     pa, alts_a = resolve_player(players_df, player_a_raw)
     pb, alts_b = resolve_player(players_df, player_b_raw)
@@ -39,9 +46,12 @@ def run_compare(player_a_raw: str, year_a: int, player_b_raw: str, year_b: int,
 
     # Normalize surface to dataset casing
     surface_norm = SURFACE_MAP.get(surface.lower(), surface)
-    # Load year match files
-    ma = load_matches(int(year_a))
-    mb = load_matches(int(year_b))
+    # Load year match files (only the requested tour/level shards)
+    ma = load_matches(int(year_a), tour, levels)
+    mb = ma if int(year_b) == int(year_a) else load_matches(int(year_b), tour, levels)
+    for y, m in sorted({int(year_a): ma, int(year_b): mb}.items()):
+        for lvl in m.attrs.get("skipped_levels", []):
+            notes.append(f"No {tour.upper()} {lvl} data published for {y} — skipped that shard.")
 
     # Elo per slice
     elo_a_res = compute_elo_for_slice(ma, pa, surface=surface_norm, best_of=best_of)
@@ -102,4 +112,5 @@ def run_compare(player_a_raw: str, year_a: int, player_b_raw: str, year_b: int,
         stats_a=stats_a, stats_b=stats_b,
         notes=notes,
         winner=winner,
+        tour=tour,
     )
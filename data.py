@@ -1,19 +1,22 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Iterable
+from typing import Dict, List, Optional, Tuple, Iterable, Sequence
 import pandas as pd
 
-from .config import PLAYERS_CSV, matches_csv_url
-from .download import fetch_to_cache
+from .config import LOADER_WORKERS
+from .download import DownloadError, fetch_to_cache
+from .sources import DEFAULT_TOUR, Source, get_tour, sources_for
 
 @dataclass(frozen=True)
 class Player:
     player_id: int
     name: str
 
-def load_players() -> pd.DataFrame:
-    path = fetch_to_cache("players", PLAYERS_CSV, "atp_players.csv")
+def load_players(tour: str = DEFAULT_TOUR) -> pd.DataFrame:
+    t = get_tour(tour)
+    path = fetch_to_cache(t.players_cache_key(), t.players_url(), t.players_cache_path(), legacy_key=t.legacy_players_key)
     df = pd.read_csv(path, low_memory=False)
 
     # Support both historical schemas:
@@ -27,7 +30,7 @@ def load_players() -> pd.DataFrame:
         last = df["name_last"].fillna("")
     else:
         raise KeyError(
-            "Could not find name columns in atp_players.csv. "
+            f"Could not find name columns in {t.players_file}. "
             f"Columns available: {list(df.columns)}"
         )
 
@@ -36,10 +39,36 @@ def load_players() -> pd.DataFrame:
     return df
 
 
-def load_matches(year: int) -> pd.DataFrame:
-    url = matches_csv_url(year)
-    path = fetch_to_cache(f"matches_{year}", url, f"atp_matches_{year}.csv")
-    df = pd.read_csv(path, low_memory=False)
+def _load_shard(source: Source, year: int) -> pd.DataFrame | None:
+    try:
+        path = fetch_to_cache(
+            source.cache_key(year), source.url(year), source.cache_path(year),
+            legacy_key=source.legacy_cache_key(year),
+        )
+    except DownloadError as e:
+        # A lower-level file that isn't published for this year is skipped, not fatal
+        if source.optional and e.status_code == 404:
+            return None
+        raise
+    return pd.read_csv(path, low_memory=False)
+
+def load_matches(year: int, tour: str = DEFAULT_TOUR, levels: Sequence[str] | None = None) -> pd.DataFrame:
+    """Load one season for `tour`, reading only the requested level shards (in parallel).
+    `levels` defaults to the tour's main level only. Levels of optional shards that
+    could not be found are listed in `df.attrs["skipped_levels"]`.
+    """
+    year = int(year)
+    srcs = sources_for(tour, year, levels)
+    if len(srcs) == 1:
+        frames = [_load_shard(srcs[0], year)]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(LOADER_WORKERS, len(srcs)))) as ex:
+            frames = list(ex.map(lambda s: _load_shard(s, year), srcs))
+    loaded = [f for f in frames if f is not None]
+    if not loaded:
+        raise ValueError(f"No {tour.upper()} match data available for {year}.")
+    df = pd.concat(loaded, ignore_index=True) if len(loaded) > 1 else loaded[0]
+    df.attrs["skipped_levels"] = [s.level for s, f in zip(srcs, frames) if f is None]
     # Normalize commonly used columns
     # Surface can be NaN for some entries; keep as is and filter later
     # best_of is int in most years but can be float; coerce
@@ -48,8 +77,8 @@ def load_matches(year: int) -> pd.DataFrame:
     df["tourney_date"] = pd.to_numeric(df.get("tourney_date", pd.NA), errors="coerce").astype("Int64")
     return df
 
-def ensure_years_loaded(years: Iterable[int]) -> Dict[int, pd.DataFrame]:
+def ensure_years_loaded(years: Iterable[int], tour: str = DEFAULT_TOUR, levels: Sequence[str] | None = None) -> Dict[int, pd.DataFrame]:
     out = {}
     for y in sorted(set(int(x) for x in years)):
-        out[y] = load_matches(y)
+        out[y] = load_matches(y, tour, levels)
     return out
@@ -3,10 +3,12 @@ import datetime as _dt
 from pathlib import Path
 import requests
 from .config import CACHE_DATA_DIR
-from .cache import connect, get_file_meta, upsert_file_meta
+from .cache import connect, delete_file_meta, get_file_meta, move_file_meta, upsert_file_meta
 
 class DownloadError(RuntimeError):
-    pass
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 def _http_get(url: str, headers: dict | None = None) -> requests.Response:
     try:
@@ -15,10 +17,29 @@ def _http_get(url: str, headers: dict | None = None) -> requests.Response:
     except requests.RequestException as e:
         raise DownloadError(f"Network error downloading {url}: {e}") from e
 
-def fetch_to_cache(key: str, url: str, filename: str) -> Path:
-    """Downloads a file and caches it. Uses ETag/Last-Modified when possible."""
+def _adopt_legacy(con, legacy_key: str, key: str, filename: str):
+    """Move a file cached under an older key/path to its current key/path, once."""
+    old = get_file_meta(con, legacy_key)
+    if not old:
+        return None
+    old_path, etag, last_modified = old
+    if not Path(old_path).exists():
+        delete_file_meta(con, legacy_key)
+        return None
+    new_path = CACHE_DATA_DIR / filename
+    new_path.parent.mkdir(parents=True, exist_ok=True)
+    Path(old_path).replace(new_path)
+    move_file_meta(con, legacy_key, key, str(new_path))
+    return str(new_path), etag, last_modified
+
+def fetch_to_cache(key: str, url: str, filename: str, *, legacy_key: str | None = None) -> Path:
+    """Downloads a file and caches it. Uses ETag/Last-Modified when possible.
+    If `key` isn't cached yet but `legacy_key` is, the old entry is migrated instead of re-downloaded.
+    """
     con = connect()
     meta = get_file_meta(con, key)
+    if not meta and legacy_key:
+        meta = _adopt_legacy(con, legacy_key, key, filename)
     headers = {}
     if meta:
         _, etag, last_modified = meta
@@ -32,9 +53,10 @@ def fetch_to_cache(key: str, url: str, filename: str) -> Path:
         return Path(meta[0])
 
     if r.status_code != 200:
-        raise DownloadError(f"Failed to download {url} (status {r.status_code})")
+        raise DownloadError(f"Failed to download {url} (status {r.status_code})", status_code=r.status_code)
 
     out_path = CACHE_DATA_DIR / filename
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_bytes(r.content)
 
     etag = r.headers.get("ETag")
@@ -3,22 +3,33 @@ import sys
 from PySide6.QtCore import Qt, QStringListModel
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
-    QSpinBox, QPushButton, QTextEdit, QCompleter
+    QSpinBox, QPushButton, QTextEdit, QCompleter, QCheckBox
 )
 
 from .data import load_players
 from .core import run_compare
+from .sources import DEFAULT_TOUR, levels as tour_levels, tours
 
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Tennis Compare")
 
-        players_df = load_players()
-        self.names = players_df["name"].dropna().astype(str).unique().tolist()
+        self.names: list[str] = []
+        self.names_model = QStringListModel(self)
 
         layout = QVBoxLayout(self)
 
+        top = QHBoxLayout()
+        layout.addLayout(top)
+        self.tour = QComboBox()
+        self.tour.addItems([t.upper() for t in tours()])
+        self.tour.setCurrentText(DEFAULT_TOUR.upper())
+        self.lower_levels = QCheckBox("Include lower-level matches")
+        top.addWidget(QLabel("Tour"))
+        top.addWidget(self.tour)
+        top.addWidget(self.lower_levels)
+
         form = QHBoxLayout()
         layout.addLayout(form)
 
@@ -66,11 +77,24 @@ class MainWindow(QWidget):
         self.out.setReadOnly(True)
         layout.addWidget(self.out)
 
+        self._load_names()
+        self.tour.currentTextChanged.connect(lambda _: self._load_names())
+
         self.resize(720, 520)
 
+    def _load_names(self) -> None:
+        # Completion list is per tour, so switching tours reloads only that tour's players
+        try:
+            players_df = load_players(self.tour.currentText().lower())
+            self.names = players_df["name"].dropna().astype(str).unique().tolist()
+        except Exception as e:
+            # Don't keep offering the previous tour's names
+            self.names = []
+            self.out.setPlainText(f"Error loading players: {e}")
+        self.names_model.setStringList(self.names)
+
     def _set_completer(self, line_edit: QLineEdit) -> None:
-        model = QStringListModel(self.names)
-        comp = QCompleter(model, self)
+        comp = QCompleter(self.names_model, self)
         comp.setCaseSensitivity(Qt.CaseInsensitive)
         comp.setFilterMode(Qt.MatchContains)  # substring match
         line_edit.setCompleter(comp)
@@ -82,16 +106,18 @@ class MainWindow(QWidget):
         y2 = int(self.y2.value())
         surface = self.surface.currentText()
         bo = int(self.bo.currentText())
+        tour = self.tour.currentText().lower()
+        levels = tour_levels(tour) if self.lower_levels.isChecked() else None
 
         try:
-            res = run_compare(p1, y1, p2, y2, surface, bo)
+            res = run_compare(p1, y1, p2, y2, surface, bo, tour=tour, levels=levels)
         except Exception as e:
             self.out.setPlainText(f"Error: {e}")
             return
 
         lines = []
         lines.append(f"{res.player_a} ({res.year_a}) vs {res.player_b} ({res.year_b})")
-        lines.append(f"Surface: {res.surface} | BO{res.best_of}")
+        lines.append(f"Tour: {res.tour.upper()} | Surface: {res.surface} | BO{res.best_of}")
         lines.append("")
         lines.append(f"Win Probability: {res.player_a}: {res.p_a_wins:.3f} | {res.player_b}: {1-res.p_a_wins:.3f}")
         if res.elo_a is not None and res.elo_b is not None:
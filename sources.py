@@ -0,0 +1,103 @@
+from __future__ import annotations
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .config import RAW_BASE
+
+@dataclass(frozen=True)
+class Source:
+    """One shard family: a tour + level, with one matches file per year.
+    Optional shards may be missing for a year (not yet published, or the level stopped).
+    """
+    tour: str
+    level: str
+    repo: str
+    file_prefix: str
+    first_year: int
+    optional: bool = False
+    # Pre-registry cache key prefix ("matches" -> "matches_{year}"), migrated on first use
+    legacy_key_prefix: str | None = None
+
+    def filename(self, year: int) -> str:
+        return f"{self.file_prefix}_{year}.csv"
+
+    def url(self, year: int) -> str:
+        return f"{RAW_BASE}/{self.repo}/master/{self.filename(year)}"
+
+    def cache_key(self, year: int) -> str:
+        return f"{self.tour}/{self.level}/matches_{year}"
+
+    def legacy_cache_key(self, year: int) -> str | None:
+        return f"{self.legacy_key_prefix}_{year}" if self.legacy_key_prefix else None
+
+    def cache_path(self, year: int) -> str:
+        # Relative to CACHE_DATA_DIR; each tour/level gets its own directory
+        return str(Path(self.tour) / self.level / self.filename(year))
+
+@dataclass(frozen=True)
+class Tour:
+    name: str
+    repo: str
+    players_file: str
+    legacy_players_key: str | None = None
+
+    def players_url(self) -> str:
+        return f"{RAW_BASE}/{self.repo}/master/{self.players_file}"
+
+    def players_cache_key(self) -> str:
+        return f"{self.name}/players"
+
+    def players_cache_path(self) -> str:
+        return str(Path(self.name) / self.players_file)
+
+DEFAULT_TOUR = "atp"
+DEFAULT_LEVELS: Tuple[str, ...] = ("main",)
+
+_TOURS: Dict[str, Tour] = {}
+_SOURCES: Dict[Tuple[str, str], Source] = {}
+
+def register_tour(tour: Tour) -> None:
+    tour = replace(tour, name=tour.name.lower())
+    _TOURS[tour.name] = tour
+
+def register_source(source: Source) -> None:
+    source = replace(source, tour=source.tour.lower(), level=source.level.lower())
+    if source.tour not in _TOURS:
+        raise KeyError(f"Unknown tour '{source.tour}'. Register it first with register_tour().")
+    _SOURCES[(source.tour, source.level)] = source
+
+def tours() -> List[str]:
+    return list(_TOURS)
+
+def get_tour(name: str) -> Tour:
+    key = (name or DEFAULT_TOUR).lower()
+    if key not in _TOURS:
+        raise KeyError(f"Unknown tour '{name}'. Available: {tours()}")
+    return _TOURS[key]
+
+def levels(tour: str) -> List[str]:
+    t = get_tour(tour).name
+    return [lvl for (tn, lvl) in _SOURCES if tn == t]
+
+def sources_for(tour: str, year: int, wanted: Iterable[str] | None = None) -> List[Source]:
+    """Shards of `tour` needed for `year`. Levels that start after `year` are skipped."""
+    t = get_tour(tour).name
+    out = []
+    for lvl in (wanted if wanted is not None else DEFAULT_LEVELS):
+        src = _SOURCES.get((t, lvl.lower()))
+        if src is None:
+            raise KeyError(f"Unknown level '{lvl}' for tour '{t}'. Available: {levels(t)}")
+        if int(year) >= src.first_year:
+            out.append(src)
+    return out
+
+# ATP main predates the registry; its old "players"/"matches_{year}" cache entries are moved over
+register_tour(Tour("atp", "tennis_atp", "atp_players.csv", legacy_players_key="players"))
+register_tour(Tour("wta", "tennis_wta", "wta_players.csv"))
+
+register_source(Source("atp", "main", "tennis_atp", "atp_matches", 1968, legacy_key_prefix="matches"))
+register_source(Source("atp", "qual_chall", "tennis_atp", "atp_matches_qual_chall", 1978, optional=True))
+register_source(Source("atp", "futures", "tennis_atp", "atp_matches_futures", 1991, optional=True))
+register_source(Source("wta", "main", "tennis_wta", "wta_matches", 1968))
+register_source(Source("wta", "qual_itf", "tennis_wta", "wta_matches_qual_itf", 1968, optional=True))
@@ -0,0 +1,19 @@
+from __future__ import annotations
+import importlib.util
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Keep config.py from creating its cache under the real home directory
+os.environ.setdefault("TENNIS_COMPARE_CACHE", tempfile.mkdtemp(prefix="tennis-compare-tests-"))
+
+# The repo root is the `tennis_compare` package itself; register it under that name
+_ROOT = Path(__file__).resolve().parent.parent
+if "tennis_compare" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "tennis_compare", _ROOT / "__init__.py", submodule_search_locations=[str(_ROOT)]
+    )
+    _pkg = importlib.util.module_from_spec(_spec)
+    sys.modules["tennis_compare"] = _pkg
+    _spec.loader.exec_module(_pkg)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from tennis_compare import data
+from tennis_compare.download import DownloadError
+
+def _stub_fetch(tmp_path, missing=()):
+    """fetch_to_cache replacement: writes one small CSV per shard, 404s for `missing` levels."""
+    def fetch(key, url, filename, *, legacy_key=None):
+        level = key.split("/")[1]
+        if level in missing:
+            raise DownloadError(f"Failed to download {url} (status 404)", status_code=404)
+        path = tmp_path / filename.replace("/", "_")
+        pd.DataFrame({
+            "winner_name": [f"{level} W"], "loser_name": [f"{level} L"],
+            "best_of": ["3"], "tourney_date": ["20110101"],
+        }).to_csv(path, index=False)
+        return path
+    return fetch
+
+def test_load_matches_combines_shards(monkeypatch, tmp_path):
+    monkeypatch.setattr(data, "fetch_to_cache", _stub_fetch(tmp_path))
+    df = data.load_matches(2011, "atp", ["main", "qual_chall", "futures"])
+    assert sorted(df["winner_name"]) == ["futures W", "main W", "qual_chall W"]
+    assert df.attrs["skipped_levels"] == []
+    assert str(df["best_of"].dtype) == "Int64"
+
+def test_missing_lower_shard_is_skipped(monkeypatch, tmp_path):
+    monkeypatch.setattr(data, "fetch_to_cache", _stub_fetch(tmp_path, missing={"futures"}))
+    df = data.load_matches(2030, "atp", ["main", "qual_chall", "futures"])
+    assert sorted(df["winner_name"]) == ["main W", "qual_chall W"]
+    assert df.attrs["skipped_levels"] == ["futures"]
+
+def test_missing_main_shard_is_fatal(monkeypatch, tmp_path):
+    monkeypatch.setattr(data, "fetch_to_cache", _stub_fetch(tmp_path, missing={"main"}))
+    with pytest.raises(DownloadError):
+        data.load_matches(2030, "atp", ["main", "qual_chall"])
@@ -0,0 +1,47 @@
+from __future__ import annotations
+import pytest
+
+pytest.importorskip("requests")
+
+from tennis_compare import cache, download
+
+class _Resp:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+@pytest.fixture
+def cache_env(monkeypatch, tmp_path):
+    db = tmp_path / "cache.sqlite3"
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr(download, "connect", lambda: cache.connect(db))
+    monkeypatch.setattr(download, "CACHE_DATA_DIR", data_dir)
+    return db, data_dir
+
+def test_legacy_entry_is_moved_not_redownloaded(monkeypatch, cache_env):
+    db, data_dir = cache_env
+    old = data_dir / "atp_matches_2011.csv"
+    old.write_text("winner_name,loser_name\n")
+    con = cache.connect(db)
+    cache.upsert_file_meta(con, "matches_2011", str(old), '"abc"', None, "2024-01-01T00:00:00Z")
+
+    sent = {}
+    def http_get(url, headers=None):
+        sent.update(headers or {})
+        return _Resp(304)
+    monkeypatch.setattr(download, "_http_get", http_get)
+
+    path = download.fetch_to_cache("atp/main/matches_2011", "http://x", "atp/main/atp_matches_2011.csv", legacy_key="matches_2011")
+    assert path == data_dir / "atp" / "main" / "atp_matches_2011.csv"
+    assert path.exists() and not old.exists()
+    assert sent["If-None-Match"] == '"abc"'
+    assert cache.get_file_meta(con, "matches_2011") is None
+    assert cache.get_file_meta(con, "atp/main/matches_2011")[0] == str(path)
+
+def test_status_code_on_download_error(monkeypatch, cache_env):
+    monkeypatch.setattr(download, "_http_get", lambda url, headers=None: _Resp(404))
+    with pytest.raises(download.DownloadError) as ei:
+        download.fetch_to_cache("wta/qual_itf/matches_2030", "http://x", "wta/qual_itf/f.csv")
+    assert ei.value.status_code == 404
@@ -0,0 +1,42 @@
+from __future__ import annotations
+import pytest
+
+from tennis_compare import sources
+from tennis_compare.sources import Source, Tour, get_tour, levels, register_source, register_tour, sources_for
+
+def test_default_levels_is_main_only():
+    assert [s.level for s in sources_for("atp", 2011)] == ["main"]
+
+def test_first_year_cutoff():
+    all_atp = levels("atp")
+    assert [s.level for s in sources_for("atp", 1977, all_atp)] == ["main"]
+    assert [s.level for s in sources_for("atp", 1980, all_atp)] == ["main", "qual_chall"]
+    assert [s.level for s in sources_for("atp", 1991, all_atp)] == ["main", "qual_chall", "futures"]
+
+def test_unknown_tour_and_level():
+    with pytest.raises(KeyError, match="Unknown tour"):
+        sources_for("itf", 2011)
+    with pytest.raises(KeyError, match="Unknown level"):
+        sources_for("wta", 2011, ["futures"])
+
+def test_shard_layout():
+    src = sources_for("wta", 2011, ["qual_itf"])[0]
+    assert src.cache_key(2011) == "wta/qual_itf/matches_2011"
+    assert src.cache_path(2011).replace("\\", "/") == "wta/qual_itf/wta_matches_qual_itf_2011.csv"
+    assert src.url(2011).endswith("/tennis_wta/master/wta_matches_qual_itf_2011.csv")
+    assert src.optional
+    assert not sources_for("wta", 2011)[0].optional
+    assert get_tour("WTA").players_cache_key() == "wta/players"
+
+def test_legacy_keys_only_for_atp():
+    assert sources_for("atp", 2011)[0].legacy_cache_key(2011) == "matches_2011"
+    assert sources_for("wta", 2011)[0].legacy_cache_key(2011) is None
+    assert get_tour("atp").legacy_players_key == "players"
+
+def test_registration_is_case_insensitive(monkeypatch):
+    monkeypatch.setattr(sources, "_TOURS", dict(sources._TOURS))
+    monkeypatch.setattr(sources, "_SOURCES", dict(sources._SOURCES))
+    register_tour(Tour("ATP_Legends", "legends", "legends_players.csv"))
+    register_source(Source("ATP_Legends", "Main", "legends", "legends_matches", 2000))
+    assert get_tour("atp_legends").name == "atp_legends"
+    assert [s.level for s in sources_for("ATP_LEGENDS", 2001, ["MAIN"])] == ["main"]